@@ -44,14 +44,36 @@ def _selected_web_apps(web_apps: list[WebApp] | None) -> list[WebApp]:
 
 
 @app.command(name='unit')
-def test_unit(web_apps: WebAppsAnnotation = None, dry: DryAnnotation = False):
+def test_unit(
+    web_apps: WebAppsAnnotation = None,
+    workers: Annotated[
+        str,
+        typer.Option(
+            '--workers',
+            '-n',
+            help='pytest-xdist worker count (`auto` = one per core, `0` = run serially).',
+        ),
+    ] = 'auto',
+    dry: DryAnnotation = False,
+):
     """
     Run unit tests.
 
-    Unit test configuration in `pyproject.toml`.
+    Unit test configuration in `pyproject.toml`. Test files are spread over pytest-xdist
+    workers; each worker gets its own test database.
     """
     for web_app in _selected_web_apps(web_apps):
-        run('pytest', 'tests', dry=dry, cwd=PROJECT_ROOT / web_app.value, env=_test_env())
+        run(
+            'pytest',
+            'tests',
+            '-n',
+            workers,
+            '--dist',
+            'loadfile',
+            dry=dry,
+            cwd=PROJECT_ROOT / web_app.value,
+            env=_test_env(),
+        )
 
 
 @app.command(name='e2e')
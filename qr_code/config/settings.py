@@ -159,6 +159,9 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = PROJECT_ROOT / 'media'
 
+# Compiled Jinja2 email templates are cached here across process restarts
+JINJA_CACHE_DIR = Path(os.getenv('JINJA_CACHE_DIR', str(PROJECT_ROOT / '.jinja_cache')))
+
 
 # Custom user model
 AUTH_USER_MODEL = 'qr_code.User'
@@ -1,20 +1,23 @@
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
-from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
 User = get_user_model()
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 from ninja_jwt.exceptions import TokenError
 from ninja_jwt.settings import api_settings
 
-from utils import PROJECT_ROOT
-
 from ..tokens import EmailConfirmationToken
-from .email_service import EmailBackendClass, asend_email, get_email_backend
+from .email_service import (
+    EmailBackendClass,
+    asend_email,
+    get_email_backend,
+    get_email_template_environment,
+)
+
+_USER_ID_CLAIM = api_settings.USER_ID_CLAIM
 
 
 @dataclass(slots=True)
@@ -49,10 +52,10 @@ class EmailConfirmationService:
         """Validate a confirmation token and return user if valid."""
         try:
             token_obj = EmailConfirmationToken(token)
-            user_id = token_obj.get(api_settings.USER_ID_CLAIM)
+            user_id = token_obj.get(_USER_ID_CLAIM)
             if user_id is None:
                 return None
-            return await sync_to_async(User.objects.get)(pk=user_id)
+            return await User.objects.aget(pk=user_id)
         except (TokenError, User.DoesNotExist):
             return None
 
@@ -61,7 +64,7 @@ class EmailConfirmationService:
         """Mark the user's email as confirmed."""
         user.email_confirmed = True
         user.email_confirmed_at = datetime.now(UTC)
-        await sync_to_async(user.save)(update_fields=['email_confirmed', 'email_confirmed_at'])
+        await user.asave(update_fields=['email_confirmed', 'email_confirmed_at'])
 
 
 def get_email_confirmation_service() -> EmailConfirmationService:
@@ -71,16 +74,10 @@ def get_email_confirmation_service() -> EmailConfirmationService:
 def render_email_confirmation_email(*, user: User, confirmation_url: str) -> tuple[str, str, str]:
     """Render email subject, text, and HTML body for a confirmation email using Jinja2.
 
-    Template: ``src/qr_code/static/emails/email_validation.j2``.
+    Template: ``qr_code/static/emails/email_validation.j2``.
     """
 
-    template_path = PROJECT_ROOT / 'src' / 'qr_code' / 'static' / 'emails'
-
-    env = Environment(
-        loader=FileSystemLoader(str(template_path)),
-        autoescape=select_autoescape(['html', 'xml']),
-    )
-    template = env.get_template('email_validation.j2')
+    template = get_email_template_environment().get_template('email_validation.j2')
 
     rendered = template.render(
         user=user,
@@ -1,11 +1,14 @@
 import logging
 from dataclasses import dataclass
+from functools import cache, lru_cache
+from pathlib import Path
 from typing import Protocol
 
 import boto3
 from asgiref.sync import sync_to_async
 from botocore.exceptions import ClientError
 from django.conf import settings
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader, select_autoescape
 from mypy_boto3_ses import SESClient
 
 logger = logging.getLogger(__name__)
@@ -27,6 +30,12 @@ class EmailBackend(Protocol):
 type EmailBackendClass = type[EmailBackend]
 
 
+@lru_cache(maxsize=4)
+def _ses_client(region: str) -> SESClient:
+    """Return a process-wide SES client so HTTPS connections are reused across sends."""
+    return boto3.client('ses', region_name=region)  # type: ignore
+
+
 @dataclass(slots=True)
 class SesEmailBackend:
     """Email backend using AWS SES."""
@@ -44,7 +53,7 @@ class SesEmailBackend:
             html_body = f'<pre>{text_body}</pre>'
 
         region = getattr(settings, 'AWS_REGION', 'us-east-1')
-        client: SESClient = boto3.client('ses', region_name=region)  # type: ignore
+        client = _ses_client(region)
 
         try:
             client.send_email(
@@ -86,6 +95,24 @@ class ConsoleEmailBackend:
             print(html_body)
 
 
+@cache
+def get_email_template_environment() -> Environment:
+    """Return the process-wide Jinja2 environment for email templates.
+
+    Templates live in ``qr_code/static/emails``. Compiled bytecode is persisted under
+    ``settings.JINJA_CACHE_DIR`` so new worker processes skip template parsing.
+    """
+
+    cache_dir = Path(settings.JINJA_CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    return Environment(
+        loader=PackageLoader('qr_code', 'static/emails'),
+        autoescape=select_autoescape(['html', 'xml']),
+        bytecode_cache=FileSystemBytecodeCache(directory=str(cache_dir)),
+    )
+
+
 EMAIL_BACKEND_KIND_TO_CLASS: dict[str, EmailBackendClass] = {
     'console': ConsoleEmailBackend,
     'ses': SesEmailBackend,
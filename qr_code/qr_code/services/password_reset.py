@@ -4,13 +4,17 @@ from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 from ninja_jwt.exceptions import TokenError
 from ninja_jwt.settings import api_settings
 
 User = get_user_model()
 from ..tokens import PasswordResetToken
-from .email_service import EmailBackendClass, asend_email, get_email_backend
+from .email_service import (
+    EmailBackendClass,
+    asend_email,
+    get_email_backend,
+    get_email_template_environment,
+)
 
 
 @dataclass(slots=True)
@@ -69,16 +73,10 @@ def get_password_reset_service() -> PasswordResetService:
 def render_password_reset_email(*, user: User, reset_url: str) -> tuple[str, str, str]:
     """Render email subject, text, and HTML body for a reset email using Jinja2.
 
-    Template: ``src/qr_code/static/emails/password_reset.j2``.
+    Template: ``qr_code/static/emails/password_reset.j2``.
     """
 
-    template_path = settings.PROJECT_ROOT / 'src' / 'qr_code' / 'static' / 'emails'
-
-    env = Environment(
-        loader=FileSystemLoader(str(template_path)),
-        autoescape=select_autoescape(['html', 'xml']),
-    )
-    template = env.get_template('password_reset.j2')
+    template = get_email_template_environment().get_template('password_reset.j2')
 
     rendered = template.render(
         user=user,
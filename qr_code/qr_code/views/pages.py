@@ -1,19 +1,28 @@
+from typing import cast
+
+from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.decorators import login_required
-from django.contrib.auth.models import AnonymousUser
-from django.http import HttpRequest, HttpResponse
+from django.http import Http404, HttpRequest, HttpResponse
 from django.shortcuts import render
 
 from ..models import QRCode
 
 
+async def _bind_user(request: HttpRequest) -> AbstractBaseUser:
+    """Resolve the logged-in user and set it as ``request.user``.
+
+    Templates read ``request.user``; binding the resolved user spares them a sync lookup.
+    Callers are guarded by @login_required, so the cast only narrows the type for checkers.
+    """
+    user = cast(AbstractBaseUser, await request.auser())
+    request.user = user
+    return user
+
+
 @login_required
 def dashboard(request: HttpRequest) -> HttpResponse:
     """Render the user dashboard with their QR codes."""
-    user = request.user
-
-    # Narrow type for static checkers; guarded by @login_required.
-    if isinstance(user, AnonymousUser):
-        raise RuntimeError('Authenticated user required')
+    user = cast(AbstractBaseUser, request.user)  # Guarded by @login_required
 
     query = request.GET.get('q', '')
     sort = request.GET.get('sort', '')
@@ -36,27 +45,24 @@ def dashboard(request: HttpRequest) -> HttpResponse:
 
 
 @login_required
-def qrcode_editor(request: HttpRequest, qr_id: str | None = None) -> HttpResponse:
+async def qrcode_editor(request: HttpRequest, qr_id: str | None = None) -> HttpResponse:
     """Render the QR code editor page for creating or editing QR codes.
 
     Args:
         request: The HTTP request object.
         qr_id: Optional UUID of the QR code to edit. If None, create mode.
     """
-    user = request.user
-
-    # Narrow type for static checkers; guarded by @login_required.
-    if isinstance(user, AnonymousUser):
-        raise RuntimeError('Authenticated user required')
+    user = await _bind_user(request)
 
     qrcode = None
     if qr_id:
         # Edit mode: fetch the QR code and validate ownership
         try:
-            qrcode = QRCode.objects.get(id=qr_id, created_by=user)
+            qrcode = await QRCode.objects.only(
+                'id', 'name', 'qr_type', 'content', 'image_file'
+            ).aget(id=qr_id, created_by=user)
         except QRCode.DoesNotExist:
             # Return 404 if QR code doesn't exist or doesn't belong to the user
-            from django.http import Http404
             raise Http404("QR Code not found")
 
     context = {'qrcode': qrcode, 'prefill': {}}
@@ -64,18 +70,15 @@ def qrcode_editor(request: HttpRequest, qr_id: str | None = None) -> HttpRespons
 
 
 @login_required
-def qrcode_duplicate(request: HttpRequest, qr_id: str) -> HttpResponse:
+async def qrcode_duplicate(request: HttpRequest, qr_id: str) -> HttpResponse:
     """Render the QR code editor in create mode, pre-filled from an existing QR code."""
-    user = request.user
-
-    # Narrow type for static checkers; guarded by @login_required.
-    if isinstance(user, AnonymousUser):
-        raise RuntimeError('Authenticated user required')
+    user = await _bind_user(request)
 
     try:
-        source = QRCode.objects.get(id=qr_id, created_by=user)
+        source = await QRCode.objects.only(
+            'name', 'qr_type', 'qr_format', 'content', 'original_url', 'use_url_shortening'
+        ).aget(id=qr_id, created_by=user)
     except QRCode.DoesNotExist:
-        from django.http import Http404
         raise Http404("QR Code not found")
 
     # Prefer the original URL (if present) for URL-type QR codes; otherwise use content.
@@ -95,6 +95,19 @@ DATABASES = {
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = COMMON_AUTH_PASSWORD_VALIDATORS
 
+# Password hashing
+# https://docs.djangoproject.com/en/6.0/topics/auth/passwords/
+# Hashing dominates login latency. Pick PASSWORD_HASH_ITERATIONS so one hash takes roughly
+# 250ms on the production hardware; 0 keeps Django's default PBKDF2 iteration count.
+PASSWORD_HASH_ITERATIONS = int(os.getenv('PASSWORD_HASH_ITERATIONS', '0'))
+PASSWORD_HASHERS = [
+    'users.hashers.TunablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 
 # Static files
 STATIC_URL = '/static/'
@@ -104,6 +117,13 @@ STATICFILES_DIRS = [
 ]
 STATIC_ROOT = PROJECT_ROOT / 'staticfiles'
 
+# Compress static files once at collectstatic time so WhiteNoise serves the pre-built
+# .gz/.br variants instead of the originals.
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedStaticFilesStorage'},
+}
+
 
 # Custom user model
 AUTH_USER_MODEL = 'users.User'
@@ -122,6 +142,9 @@ JWT_EXP_DELTA_SECONDS = int(os.getenv('JWT_EXP_DELTA_SECONDS', str(14 * 24 * 360
 BASE_URL = os.getenv('BASE_URL', 'http://localhost:8010')
 EMAIL_CONFIRMATION_TOKEN_TTL_HOURS = int(os.getenv('EMAIL_CONFIRMATION_TOKEN_TTL_HOURS', '48'))
 PASSWORD_RESET_TOKEN_TTL_HOURS = int(os.getenv('PASSWORD_RESET_TOKEN_TTL_HOURS', '48'))
+# Repeat resend-confirmation/forgot-password requests for one address within this many seconds
+# are answered without sending another email.
+EMAIL_REQUEST_COOLDOWN_SECONDS = int(os.getenv('EMAIL_REQUEST_COOLDOWN_SECONDS', '60'))
 
 # Email backend configuration
 EMAIL_BACKENDS = os.getenv('EMAIL_BACKENDS', 'console')  # comma-separated: console,ses
@@ -7,7 +7,9 @@ https://docs.djangoproject.com/en/6.0/howto/deployment/wsgi/
 """
 
 import os
+from pathlib import Path
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 from whitenoise import WhiteNoise
 
@@ -16,9 +18,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 application = get_wsgi_application()
 
 # Wrap with WhiteNoise for static file serving in production
-if not os.environ.get('DEBUG', 'False').lower() in ['true', '1']:
-    from pathlib import Path
-
+if not settings.DEBUG:
     project_root = Path(__file__).resolve().parent.parent
     static_root = project_root / 'staticfiles'
     application = WhiteNoise(
@@ -1,11 +1,14 @@
 import pytest
-from users.users.models import User
-from users.users.tokens import CustomAccessToken
+from users.models import User
+from users.tokens import CustomAccessToken
 
 pytestmark = [pytest.mark.django_db, pytest.mark.integration]
 
 
 def test_login_returns_jwt_for_active_user(api_client, regular_user: User):
+    regular_user.email_confirmed = True
+    regular_user.save(update_fields=['email_confirmed'])
+
     response = api_client.post(
         '/auth/login',
         json={'email': regular_user.email, 'password': 'password123'},
@@ -1,30 +1,40 @@
 import pytest
-from users.users.models import CreditTransaction, CreditTransactionType, User
+from users.models import CreditTransaction, CreditTransactionType, User
+from users.services.credits import apply_credit_transaction
+from users.tokens import CustomAccessToken
 
 pytestmark = [pytest.mark.django_db, pytest.mark.integration]
 
 
-def test_admin_can_add_credits_to_user(api_client, admin_user, regular_user: User):
+def _bearer(user: User) -> dict[str, str]:
+    return {'Authorization': f'Bearer {CustomAccessToken.for_user(user)}'}
+
+
+def test_admin_can_add_credits_to_user(
+    api_client, admin_user, regular_user: User, django_assert_max_num_queries
+):
     """Test that admin can add credits to a user account."""
-    api_client.force_authenticate(user=admin_user)
+    headers = _bearer(admin_user)
 
     assert regular_user.credits == 0
 
-    response = api_client.post(
-        f'/api/users/{regular_user.id}/credits',
-        {
-            'transaction_type': 'purchase',
-            'amount': 100,
-            'description': 'Initial purchase',
-        },
-        format='json',
-    )
+    # Auth user lookup, existence check, then INSERT + UPDATE inside one savepoint
+    with django_assert_max_num_queries(6):
+        response = api_client.post(
+            f'/users/{regular_user.id}/credits',
+            json={
+                'transaction_type': 'purchase',
+                'amount': 100,
+                'description': 'Initial purchase',
+            },
+            headers=headers,
+        )
 
-    assert response.status_code == 201
-    assert response.data['amount'] == 100
-    assert response.data['type'] == 'purchase'
-    assert response.data['description'] == 'Initial purchase'
-    assert response.data['user_id'] == str(regular_user.id)
+    assert response.status_code == 200
+    assert response.json()['amount'] == 100
+    assert response.json()['type'] == 'purchase'
+    assert response.json()['description'] == 'Initial purchase'
+    assert response.json()['user_id'] == str(regular_user.id)
 
     regular_user.refresh_from_db()
     assert regular_user.credits == 100
@@ -32,25 +42,25 @@ def test_admin_can_add_credits_to_user(api_client, admin_user, regular_user: Use
 
 def test_admin_can_remove_credits_from_user(api_client, admin_user, regular_user: User):
     """Test that admin can remove credits from a user account."""
-    api_client.force_authenticate(user=admin_user)
+    headers = _bearer(admin_user)
 
     # Set initial credits
-    regular_user.credits = 100
-    regular_user.save()
+    User.objects.filter(pk=regular_user.pk).update(credits=100)
+    regular_user.refresh_from_db(fields=['credits'])
 
     response = api_client.post(
-        f'/api/users/{regular_user.id}/credits',
-        {
+        f'/users/{regular_user.id}/credits',
+        json={
             'transaction_type': 'spend',
             'amount': -30,
             'description': 'Spent credits',
         },
-        format='json',
+        headers=headers,
     )
 
-    assert response.status_code == 201
-    assert response.data['amount'] == -30
-    assert response.data['type'] == 'spend'
+    assert response.status_code == 200
+    assert response.json()['amount'] == -30
+    assert response.json()['type'] == 'spend'
 
     regular_user.refresh_from_db()
     assert regular_user.credits == 70
@@ -58,20 +68,20 @@ def test_admin_can_remove_credits_from_user(api_client, admin_user, regular_user
 
 def test_admin_can_adjust_credits(api_client, admin_user, regular_user: User):
     """Test that admin can adjust credits with adjustment type."""
-    api_client.force_authenticate(user=admin_user)
+    headers = _bearer(admin_user)
 
     response = api_client.post(
-        f'/api/users/{regular_user.id}/credits',
-        {
+        f'/users/{regular_user.id}/credits',
+        json={
             'transaction_type': 'adjustment',
             'amount': 50,
             'description': 'Manual adjustment',
         },
-        format='json',
+        headers=headers,
     )
 
-    assert response.status_code == 201
-    assert response.data['type'] == 'adjustment'
+    assert response.status_code == 200
+    assert response.json()['type'] == 'adjustment'
 
     regular_user.refresh_from_db()
     assert regular_user.credits == 50
@@ -79,20 +89,20 @@ def test_admin_can_adjust_credits(api_client, admin_user, regular_user: User):
 
 def test_admin_can_refund_credits(api_client, admin_user, regular_user: User):
     """Test that admin can refund credits."""
-    api_client.force_authenticate(user=admin_user)
+    headers = _bearer(admin_user)
 
     response = api_client.post(
-        f'/api/users/{regular_user.id}/credits',
-        {
+        f'/users/{regular_user.id}/credits',
+        json={
             'transaction_type': 'refund',
             'amount': 25,
             'description': 'Refund for cancellation',
         },
-        format='json',
+        headers=headers,
     )
 
-    assert response.status_code == 201
-    assert response.data['type'] == 'refund'
+    assert response.status_code == 200
+    assert response.json()['type'] == 'refund'
 
     regular_user.refresh_from_db()
     assert regular_user.credits == 25
@@ -100,19 +110,19 @@ def test_admin_can_refund_credits(api_client, admin_user, regular_user: User):
 
 def test_credit_transaction_creates_audit_record(api_client, admin_user, regular_user: User):
     """Test that credit transactions create audit records."""
-    api_client.force_authenticate(user=admin_user)
+    headers = _bearer(admin_user)
 
     response = api_client.post(
-        f'/api/users/{regular_user.id}/credits',
-        {
+        f'/users/{regular_user.id}/credits',
+        json={
             'transaction_type': 'purchase',
             'amount': 100,
             'description': 'Test purchase',
         },
-        format='json',
+        headers=headers,
     )
 
-    assert response.status_code == 201
+    assert response.status_code == 200
 
     transactions = CreditTransaction.objects.filter(user=regular_user)
     assert transactions.count() == 1
@@ -125,106 +135,110 @@ def test_credit_transaction_creates_audit_record(api_client, admin_user, regular
 
 def test_invalid_transaction_type_returns_400(api_client, admin_user, regular_user: User):
     """Test that invalid transaction type returns 400 error."""
-    api_client.force_authenticate(user=admin_user)
+    headers = _bearer(admin_user)
 
     response = api_client.post(
-        f'/api/users/{regular_user.id}/credits',
-        {
+        f'/users/{regular_user.id}/credits',
+        json={
             'transaction_type': 'invalid_type',
             'amount': 100,
             'description': 'Invalid transaction',
         },
-        format='json',
+        headers=headers,
     )
 
     assert response.status_code == 400
-    assert 'Invalid transaction type' in response.data['detail']
+    assert 'Invalid transaction type' in response.json()['detail']
 
 
 def test_nonexistent_user_returns_404(api_client, admin_user):
     """Test that credits endpoint returns 404 for nonexistent user."""
-    api_client.force_authenticate(user=admin_user)
+    headers = _bearer(admin_user)
 
     fake_uuid = '00000000-0000-0000-0000-000000000000'
     response = api_client.post(
-        f'/api/users/{fake_uuid}/credits',
-        {
+        f'/users/{fake_uuid}/credits',
+        json={
             'transaction_type': 'purchase',
             'amount': 100,
             'description': 'Test',
         },
-        format='json',
+        headers=headers,
     )
 
     assert response.status_code == 404
 
 
-def test_admin_can_get_user_credits_balance(api_client, admin_user, regular_user: User):
+def test_admin_can_get_user_credits_balance(
+    api_client, admin_user, regular_user: User, django_assert_max_num_queries
+):
     """Test that admin can retrieve user's credit balance."""
-    api_client.force_authenticate(user=admin_user)
+    headers = _bearer(admin_user)
 
-    regular_user.credits = 250
-    regular_user.save()
+    User.objects.filter(pk=regular_user.pk).update(credits=250)
+    regular_user.refresh_from_db(fields=['credits'])
 
-    response = api_client.get(f'/api/users/{regular_user.id}/credits')
+    # Auth user lookup and the balance read
+    with django_assert_max_num_queries(2):
+        response = api_client.get(f'/users/{regular_user.id}/credits', headers=headers)
 
     assert response.status_code == 200
-    assert response.data['user_id'] == str(regular_user.id)
-    assert response.data['credits'] == 250
+    assert response.json()['user_id'] == str(regular_user.id)
+    assert response.json()['credits'] == 250
 
 
 def test_get_credits_nonexistent_user_returns_404(api_client, admin_user):
     """Test that getting credits for nonexistent user returns 404."""
-    api_client.force_authenticate(user=admin_user)
+    headers = _bearer(admin_user)
 
     fake_uuid = '00000000-0000-0000-0000-000000000000'
-    response = api_client.get(f'/api/users/{fake_uuid}/credits')
+    response = api_client.get(f'/users/{fake_uuid}/credits', headers=headers)
 
     assert response.status_code == 404
 
 
-def test_non_admin_cannot_add_credits(api_client, regular_user):
-    """Test that non-admin users cannot add credits."""
-    api_client.force_authenticate(user=regular_user)
-
-    other_user = User.objects.create_user(email='other@example.com', password='password')
-
-    response = api_client.post(
-        f'/api/users/{other_user.id}/credits',
-        {
-            'transaction_type': 'purchase',
-            'amount': 100,
-            'description': 'Unauthorized attempt',
-        },
-        format='json',
-    )
+@pytest.mark.parametrize(
+    'method, payload',
+    [
+        ('get', None),
+        (
+            'post',
+            {
+                'transaction_type': 'purchase',
+                'amount': 100,
+                'description': 'Unauthorized attempt',
+            },
+        ),
+    ],
+)
+def test_non_admin_cannot_access_credits(api_client, admin_user, regular_user, method, payload):
+    """Test that non-admin users cannot read or change anyone's credits."""
+    headers = _bearer(regular_user)
+
+    url = f'/users/{admin_user.id}/credits'
+    if payload is None:
+        response = getattr(api_client, method)(url, headers=headers)
+    else:
+        response = getattr(api_client, method)(url, json=payload, headers=headers)
 
     assert response.status_code == 401
 
 
 def test_multiple_transactions_update_balance_correctly(api_client, admin_user, regular_user: User):
     """Test that multiple transactions correctly update the balance."""
-    api_client.force_authenticate(user=admin_user)
+    headers = _bearer(admin_user)
 
-    # Add 100 credits
+    # One request through the API; the rest go straight to the service
     api_client.post(
-        f'/api/users/{regular_user.id}/credits',
-        {'transaction_type': 'purchase', 'amount': 100, 'description': 'Purchase 1'},
-        format='json',
+        f'/users/{regular_user.id}/credits',
+        json={'transaction_type': 'purchase', 'amount': 100, 'description': 'Purchase 1'},
+        headers=headers,
     )
-
-    # Add 50 more credits
-    api_client.post(
-        f'/api/users/{regular_user.id}/credits',
-        {'transaction_type': 'purchase', 'amount': 50, 'description': 'Purchase 2'},
-        format='json',
+    apply_credit_transaction(
+        regular_user.id, amount=50, transaction_type='purchase', description='Purchase 2'
     )
-
-    # Spend 30 credits
-    api_client.post(
-        f'/api/users/{regular_user.id}/credits',
-        {'transaction_type': 'spend', 'amount': -30, 'description': 'Spend 1'},
-        format='json',
+    apply_credit_transaction(
+        regular_user.id, amount=-30, transaction_type='spend', description='Spend 1'
     )
 
     regular_user.refresh_from_db()
@@ -0,0 +1,80 @@
+import pytest
+from tests.factories import UserFactory
+from users.models import User
+from users.tokens import CustomAccessToken, CustomRefreshToken, PasswordResetToken
+
+pytestmark = [pytest.mark.django_db, pytest.mark.integration]
+
+
+@pytest.fixture
+def user() -> User:
+    return UserFactory(email_confirmed=True)
+
+
+@pytest.fixture
+def tokens(user: User) -> tuple[str, str]:
+    """Access and refresh tokens issued before anything happens to the user."""
+    return str(CustomAccessToken.for_user(user)), str(CustomRefreshToken.for_user(user))
+
+
+def _access_accepted(api_client, access: str) -> bool:
+    response = api_client.put('/account', json={}, headers={'Authorization': f'Bearer {access}'})
+    assert response.status_code in (200, 401)
+    return response.status_code == 200
+
+
+def _refresh_accepted(api_client, refresh: str) -> bool:
+    response = api_client.post('/auth/refresh', json={'refresh_token': refresh})
+    assert response.status_code in (200, 401)
+    return response.status_code == 200
+
+
+def test_tokens_are_accepted_while_nothing_changes(api_client, user: User, tokens):
+    """Issuing more tokens or editing the profile must not revoke earlier ones."""
+    access, refresh = tokens
+    CustomAccessToken.for_user(user)
+    user.name = 'Renamed'
+    user.save(update_fields=['name'])
+
+    assert _access_accepted(api_client, access)
+    assert _refresh_accepted(api_client, refresh)
+
+
+def test_password_reset_revokes_tokens(api_client, user: User, tokens):
+    access, refresh = tokens
+
+    response = api_client.post(
+        '/auth/reset-password',
+        json={
+            'token': str(PasswordResetToken.for_user(user)),
+            'password': 'newpass123',
+            'password_confirm': 'newpass123',
+        },
+    )
+
+    assert response.status_code == 200
+    assert not _access_accepted(api_client, access)
+    assert not _refresh_accepted(api_client, refresh)
+
+
+@pytest.mark.parametrize(
+    'method, suffix, payload',
+    [
+        ('delete', '', None),
+        ('post', '/deactivate', {'reason': 'Closed by support'}),
+    ],
+)
+def test_admin_removal_revokes_tokens(
+    api_client, admin_user: User, user: User, tokens, method, suffix, payload
+):
+    """Deleting or deactivating a user through the admin API revokes their tokens."""
+    access, refresh = tokens
+    headers = {'Authorization': f'Bearer {CustomAccessToken.for_user(admin_user)}'}
+
+    request = getattr(api_client, method)
+    kwargs = {'headers': headers} if payload is None else {'json': payload, 'headers': headers}
+    response = request(f'/users/{user.id}{suffix}', **kwargs)
+
+    assert response.status_code in (200, 204)
+    assert not _access_accepted(api_client, access)
+    assert not _refresh_accepted(api_client, refresh)
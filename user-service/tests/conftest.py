@@ -1,18 +1,23 @@
 from datetime import timedelta
 
 import pytest
+from django.core.cache import cache
+from django.test import override_settings
 from tests.factories import UserFactory
 
+FAST_PASSWORD_HASHERS = ['tests.hashers.PlainTextPasswordHasher']
+SHARED_ADMIN_USER_EMAIL = 'shared-admin-user@example.com'
+SHARED_REGULAR_USER_EMAIL = 'shared-regular-user@example.com'
 
-@pytest.fixture(autouse=True)
-def _jwt_settings(settings):
-    """Make JWT behavior deterministic for tests."""
-    settings.JWT_SECRET = 'test-secret'
-    settings.JWT_ALGORITHM = 'HS256'
-    settings.JWT_EXP_DELTA_SECONDS = 3600
-
-    # Configure NINJA_JWT settings
-    settings.NINJA_JWT = {
+
+@pytest.fixture(scope='session', autouse=True)
+def _jwt_settings():
+    """Make JWT behavior deterministic for tests.
+
+    Applied once for the whole session, so ninja-jwt does not reload its settings for every
+    test.
+    """
+    ninja_jwt = {
         'ACCESS_TOKEN_LIFETIME': timedelta(seconds=3600),
         'REFRESH_TOKEN_LIFETIME': timedelta(days=30),
         'ROTATE_REFRESH_TOKENS': False,
@@ -28,28 +33,87 @@ def _jwt_settings(settings):
         'USER_ID_FIELD': 'id',
         'USER_ID_CLAIM': 'sub',
         'USER_AUTHENTICATION_RULE': 'ninja_jwt.authentication.default_user_authentication_rule',
-        'AUTH_TOKEN_CLASSES': ('users.users.tokens.CustomAccessToken',),
+        'AUTH_TOKEN_CLASSES': ('users.tokens.CustomAccessToken',),
         'TOKEN_TYPE_CLAIM': 'token_type',
         'JTI_CLAIM': 'jti',
         'SLIDING_TOKEN_REFRESH_EXP_CLAIM': 'refresh_exp',
         'SLIDING_TOKEN_LIFETIME': timedelta(minutes=5),
         'SLIDING_TOKEN_REFRESH_LIFETIME': timedelta(days=1),
     }
+    with override_settings(
+        JWT_SECRET='test-secret',
+        JWT_ALGORITHM='HS256',
+        JWT_EXP_DELTA_SECONDS=3600,
+        NINJA_JWT=ninja_jwt,
+    ):
+        yield
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session', autouse=True)
+def _fast_password_hasher():
+    """Use a no-op hasher so creating and logging in users does not dominate test time."""
+    with override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Start every test with an empty cache so rate-limit keys do not leak between tests."""
+    cache.clear()
+
+
+@pytest.fixture(scope='session')
 def api_client():
+    """Share one client; ninja's TestClient keeps no per-test state such as cookies."""
     from ninja.testing import TestClient
-    from users.users.api import api
+    from users.api import api
 
     return TestClient(api)
 
 
+@pytest.fixture(scope='session')
+def _shared_user_pks(django_db_setup, django_db_blocker):
+    """Create the shared admin and regular users once, outside the per-test transactions.
+
+    Each test runs in a transaction that is rolled back, so changes made to these users by
+    one test never leak into the next. The rows are removed again at the end of the session
+    so a reused test database starts clean.
+    """
+    from users.models import User
+
+    emails = [SHARED_ADMIN_USER_EMAIL, SHARED_REGULAR_USER_EMAIL]
+    with django_db_blocker.unblock():
+        User.objects.filter(email__in=emails).delete()
+        admin, regular = UserFactory.bulk_create(
+            {'email': SHARED_ADMIN_USER_EMAIL, 'is_staff': True, 'is_superuser': True},
+            {'email': SHARED_REGULAR_USER_EMAIL},
+        )
+    yield {'admin': admin.pk, 'regular': regular.pk}
+    with django_db_blocker.unblock():
+        User.objects.filter(email__in=emails).delete()
+
+
+# Fresh instances per test, so in-memory edits are not shared between tests.
 @pytest.fixture()
-def admin_user():
-    return UserFactory(is_staff=True, is_superuser=True)
+def admin_user(db, _shared_user_pks):
+    from users.models import User
+
+    return User.objects.get(pk=_shared_user_pks['admin'])
 
 
 @pytest.fixture()
-def regular_user():
-    return UserFactory()
+def regular_user(db, _shared_user_pks):
+    from users.models import User
+
+    return User.objects.get(pk=_shared_user_pks['regular'])
+
+
+@pytest.fixture(scope='session')
+def regular_user_access_token(_shared_user_pks, django_db_blocker) -> str:
+    """Access token for the shared regular user, signed once per session."""
+    from users.models import User
+    from users.tokens import CustomAccessToken
+
+    with django_db_blocker.unblock():
+        user = User.objects.get(pk=_shared_user_pks['regular'])
+    return str(CustomAccessToken.for_user(user))
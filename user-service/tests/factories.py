@@ -1,8 +1,19 @@
+from functools import lru_cache
+from typing import Any
+
 import factory
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
 from factory import Faker
 from factory.django import DjangoModelFactory
 
 
+@lru_cache(maxsize=32)
+def _hash_password(raw_password: str, hashers: tuple[str, ...]) -> str:
+    """Hash each password once per ``hashers`` configuration (used only as the cache key)."""
+    return make_password(raw_password)
+
+
 class UserFactory(DjangoModelFactory):
     class Meta:
         model = 'users.User'
@@ -12,11 +23,19 @@ class UserFactory(DjangoModelFactory):
     status = 'ACTIVE'
     is_staff = False
     is_superuser = False
+    password = 'password123'
+
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        # Store the hash with the INSERT instead of hashing and saving again afterwards.
+        kwargs['password'] = _hash_password(kwargs['password'], tuple(settings.PASSWORD_HASHERS))
+        return super()._create(model_class, *args, **kwargs)
 
-    @factory.post_generation
-    def password(self, create: bool, extracted: str | None, **kwargs):
-        if not create:
-            return
-        raw_password = extracted or 'password123'
-        self.set_password(raw_password)  # type: ignore
-        self.save(update_fields=['password'])  # type: ignore
+    @classmethod
+    def bulk_create(cls, *overrides: dict[str, Any]) -> list:
+        """Create one user per ``overrides`` dict with a single INSERT."""
+        hashers = tuple(settings.PASSWORD_HASHERS)
+        users = [cls.build(**kwargs) for kwargs in overrides]
+        for user in users:
+            user.password = _hash_password(user.password, hashers)
+        return cls._meta.model.objects.bulk_create(users)
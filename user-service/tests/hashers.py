@@ -0,0 +1,27 @@
+from django.contrib.auth.hashers import BasePasswordHasher
+from django.utils.crypto import constant_time_compare
+
+
+class PlainTextPasswordHasher(BasePasswordHasher):
+    """Test-only hasher that stores passwords as-is, so checking one is a string comparison."""
+
+    algorithm = 'plain'
+
+    def salt(self) -> str:
+        return ''
+
+    def encode(self, password: str, salt: str) -> str:
+        return f'{self.algorithm}$${password}'
+
+    def decode(self, encoded: str) -> dict[str, str]:
+        algorithm, salt, password = encoded.split('$', 2)
+        return {'algorithm': algorithm, 'hash': password, 'salt': salt}
+
+    def verify(self, password: str, encoded: str) -> bool:
+        return constant_time_compare(encoded, self.encode(password, ''))
+
+    def safe_summary(self, encoded: str) -> dict[str, str]:
+        return {'algorithm': self.algorithm}
+
+    def harden_runtime(self, password: str, encoded: str) -> None:
+        pass
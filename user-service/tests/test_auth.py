@@ -2,33 +2,22 @@
 
 import pytest
 from django.contrib.auth import get_user_model
-from ninja.testing import TestClient
-
-from users.api import api
 
 User = get_user_model()
 
 
-@pytest.fixture
-def api_client():
-    """Return a test client for the API."""
-    return TestClient(api)
-
-
 @pytest.fixture
 def user(db):
     """Create a test user with confirmed email."""
     from datetime import UTC, datetime
 
-    user = User.objects.create_user(
+    return User.objects.create_user(
         email='test@example.com',
         password='testpass123',
         name='Test User',
+        email_confirmed=True,
+        email_confirmed_at=datetime.now(UTC),
     )
-    user.email_confirmed = True
-    user.email_confirmed_at = datetime.now(UTC)
-    user.save()
-    return user
 
 
 @pytest.mark.django_db
@@ -105,6 +94,61 @@ class TestSignupEndpoint:
         assert user.email_confirmed is False
         assert user.email_confirmed_at is None
 
+    def test_signup_sends_confirmation_after_commit(
+        self, api_client, monkeypatch, django_capture_on_commit_callbacks
+    ):
+        """Test that the confirmation email waits for the user row to be committed."""
+        sent: list[str] = []
+        monkeypatch.setattr(
+            'users.services.email_confirmation.send_email',
+            lambda **kwargs: sent.append(kwargs['to']),
+        )
+        data = {
+            'name': 'Commit User',
+            'email': 'commit@example.com',
+            'password': 'password123',
+        }
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            response = api_client.post('/auth/signup', json=data)
+            assert sent == []
+
+        assert response.status_code == 201
+        assert len(callbacks) == 1
+        assert sent == ['commit@example.com']
+
+    def test_signup_rollback_sends_no_confirmation(
+        self, api_client, monkeypatch, django_capture_on_commit_callbacks
+    ):
+        """Test that no confirmation email is sent when creating the user rolls back."""
+        from django.core.exceptions import ValidationError
+
+        sent: list[str] = []
+        monkeypatch.setattr(
+            'users.services.email_confirmation.send_email',
+            lambda **kwargs: sent.append(kwargs['to']),
+        )
+        create_user = User.objects.create_user
+
+        def create_user_then_fail(**kwargs):
+            create_user(**kwargs)
+            raise ValidationError('Enter a valid name.')
+
+        monkeypatch.setattr(User.objects, 'create_user', create_user_then_fail)
+        data = {
+            'name': 'Rollback User',
+            'email': 'rollback@example.com',
+            'password': 'password123',
+        }
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            response = api_client.post('/auth/signup', json=data)
+
+        assert response.status_code == 400
+        assert callbacks == []
+        assert sent == []
+        assert not User.objects.filter(email='rollback@example.com').exists()
+
 
 @pytest.mark.django_db
 class TestLoginEndpoint:
@@ -218,6 +262,29 @@ class TestPasswordResetFlow:
         assert response.status_code == 400
         assert 'match' in response.json()['detail'].lower()
 
+    def test_reset_password_success(self, api_client, user):
+        """Test that a valid token sets the new password and revokes existing tokens."""
+        from users.tokens import PasswordResetToken
+
+        data = {
+            'token': str(PasswordResetToken.for_user(user)),
+            'password': 'newpass123',
+            'password_confirm': 'newpass123',
+        }
+
+        response = api_client.post('/auth/reset-password', json=data)
+
+        assert response.status_code == 200
+        user.refresh_from_db()
+        assert user.check_password('newpass123')
+        assert not user.check_password('testpass123')
+        assert user.token_version == 1
+
+        login = api_client.post(
+            '/auth/login', json={'email': user.email, 'password': 'testpass123'}
+        )
+        assert login.status_code == 400
+
 
 @pytest.mark.django_db
 class TestEmailConfirmation:
@@ -251,3 +318,77 @@ class TestEmailConfirmation:
         response = api_client.post('/auth/confirm-email', json=data)
 
         assert response.status_code == 400
+
+    def test_confirmation_url_matches_reversed_path(self, settings):
+        """Test that the cached path template produces the same URL as reverse()."""
+        from django.urls import reverse
+
+        from users.services.email_confirmation import EmailConfirmationService
+
+        settings.BASE_URL = 'https://users.example.com/'
+        service = EmailConfirmationService(email_backend_classes=[])
+
+        url = service._build_confirmation_url('abc.def-ghi_jkl')
+
+        assert url == 'https://users.example.com' + reverse(
+            'confirm-email-page', args=['abc.def-ghi_jkl']
+        )
+
+
+@pytest.mark.django_db
+class TestEmailRequestThrottle:
+    """Tests for the cooldown on resend-confirmation and forgot-password emails."""
+
+    @pytest.fixture
+    def sent(self, monkeypatch) -> list[str]:
+        """Recipients of every confirmation and reset email sent during the test."""
+        recipients: list[str] = []
+
+        def fake_send_email(**kwargs):
+            recipients.append(kwargs['to'])
+
+        monkeypatch.setattr('users.services.email_confirmation.send_email', fake_send_email)
+        monkeypatch.setattr('users.services.password_reset.send_email', fake_send_email)
+        return recipients
+
+    def test_repeat_request_is_suppressed(self, api_client, user, sent):
+        """Test that a second request for the same address sends no second email."""
+        for _ in range(2):
+            response = api_client.post('/auth/forgot-password', json={'email': user.email})
+            assert response.status_code == 200
+
+        assert sent == [user.email]
+
+    def test_other_address_is_not_suppressed(self, api_client, user, sent):
+        """Test that the cooldown is kept per address."""
+        other = User.objects.create_user(
+            email='other@example.com',
+            password='password123',
+            email_confirmed=True,
+        )
+
+        api_client.post('/auth/forgot-password', json={'email': user.email})
+        api_client.post('/auth/forgot-password', json={'email': other.email})
+
+        assert sent == [user.email, other.email]
+
+    def test_other_kind_is_not_suppressed(self, api_client, sent):
+        """Test that a reset request does not block a confirmation resend."""
+        unconfirmed = User.objects.create_user(
+            email='unconfirmed@example.com',
+            password='password123',
+        )
+
+        api_client.post('/auth/forgot-password', json={'email': unconfirmed.email})
+        api_client.post('/auth/resend-confirmation', json={'email': unconfirmed.email})
+
+        assert sent == [unconfirmed.email, unconfirmed.email]
+
+    def test_cooldown_comes_from_settings(self, api_client, user, sent, settings):
+        """Test that EMAIL_REQUEST_COOLDOWN_SECONDS controls the window."""
+        settings.EMAIL_REQUEST_COOLDOWN_SECONDS = 0  # Cache entries expire immediately
+
+        for _ in range(2):
+            api_client.post('/auth/forgot-password', json={'email': user.email})
+
+        assert sent == [user.email, user.email]
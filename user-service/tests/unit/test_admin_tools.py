@@ -1,15 +1,19 @@
 import pytest
 from django.urls import reverse
-from users.users.models import User
+from tests.factories import UserFactory
+from users.admin import masked_environment
+from users.models import User
 
 pytestmark = [pytest.mark.django_db, pytest.mark.unit]
 
+ADMIN_TOOLS_URL = reverse('custom_admin:admin_tools')
 
-def test_tools_view_requires_superuser(client, regular_user: User):
-    """Non-superusers should be denied access to the tools view."""
 
-    client.force_login(regular_user)
-    url = reverse('custom_admin:admin_tools')
+def test_tools_view_requires_superuser(client):
+    """Non-superuser staff should be denied access to the tools view."""
+
+    client.force_login(UserFactory(is_staff=True))
+    url = ADMIN_TOOLS_URL
 
     response = client.get(url)
 
@@ -17,37 +21,50 @@ def test_tools_view_requires_superuser(client, regular_user: User):
     assert 'You do not have permission' in response.content.decode()
 
 
-def test_show_environment_masks_sensitive_values(client, admin_user: User, monkeypatch):
-    """Environment variables should be masked except for whitelisted keys."""
+def test_show_environment_lists_masked_variables(client, admin_user: User):
+    """The tools view should list the environment through masked_environment."""
 
     client.force_login(admin_user)
-    url = reverse('custom_admin:admin_tools')
-
-    monkeypatch.setenv('MY_SECRET_TOKEN', 'super-secret-value')
+    url = ADMIN_TOOLS_URL
 
     response = client.post(url, {'show_environment': '1'})
 
     assert response.status_code == 200
-    env_vars = response.context['environment_variables']
-    env_dict = dict(env_vars or [])
-    masked_value = env_dict.get('MY_SECRET_TOKEN')
-    assert masked_value is not None
+    assert response.context['environment_variables'] == masked_environment()
+
+
+def test_masked_environment_masks_sensitive_values():
+    """Environment variables should be masked except for whitelisted keys."""
+
+    env_dict = dict(
+        masked_environment(
+            {
+                'MY_SECRET_TOKEN': 'super-secret-value',
+                'AWS_REGION': 'eu-west-1',
+                'DJANGO_SECRET_KEY': 'excluded',
+            }
+        )
+    )
+
+    masked_value = env_dict['MY_SECRET_TOKEN']
     assert masked_value != 'super-secret-value'
     assert '*' in masked_value
+    assert env_dict['AWS_REGION'] == 'eu-west-1'
+    assert 'DJANGO_SECRET_KEY' not in env_dict
 
 
 def test_send_test_email_invokes_service(client, admin_user: User, monkeypatch):
     """Sending a test email should call the email service."""
 
     client.force_login(admin_user)
-    url = reverse('custom_admin:admin_tools')
+    url = ADMIN_TOOLS_URL
     captured: dict[str, str] = {}
 
     def fake_send_email(**kwargs):
         captured['to'] = kwargs['to']
         return 1, 0
 
-    monkeypatch.setattr('users.users.admin.send_email', fake_send_email)
+    monkeypatch.setattr('users.admin.send_email', fake_send_email)
 
     response = client.post(
         url,
@@ -70,4 +87,4 @@ def test_admin_dashboard_shows_tools_link(client, admin_user: User):
     assert response.status_code == 200
     content = response.content.decode()
     assert 'Admin Tools' in content
-    assert reverse('custom_admin:admin_tools') in content
+    assert ADMIN_TOOLS_URL in content
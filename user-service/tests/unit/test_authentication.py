@@ -1,69 +1,67 @@
+from datetime import timedelta
 from unittest.mock import Mock
 
 import pytest
-from users.users.auth import AdminAuth, JWTAuth
-from users.users.models import User
-from users.users.tokens import CustomAccessToken
+from ninja_jwt.exceptions import AuthenticationFailed, InvalidToken
+from tests.factories import UserFactory
+from users.auth import AdminAuth, JWTAuth
+from users.models import User
+from users.tokens import CustomAccessToken
 
 pytestmark = [pytest.mark.django_db, pytest.mark.unit]
 
 
-def test_jwt_auth_returns_none_without_valid_token():
+def test_jwt_auth_rejects_empty_token():
     request = Mock()
 
-    result = JWTAuth().authenticate(request, '')
+    with pytest.raises(InvalidToken):
+        JWTAuth().authenticate(request, '')
 
-    assert result is None
-
-
-def test_jwt_auth_accepts_valid_token(regular_user: User):
-    token = CustomAccessToken.for_user(regular_user)
 
+def test_jwt_auth_accepts_valid_token(regular_user: User, regular_user_access_token: str):
     request = Mock()
-    result = JWTAuth().authenticate(request, str(token))
+    result = JWTAuth().authenticate(request, regular_user_access_token)
 
     assert result is not None
     assert result.id == regular_user.id
 
 
-def test_jwt_auth_returns_none_for_expired_token(regular_user: User, settings):
-    # Create a token with very short lifetime
-    settings.NINJA_JWT['ACCESS_TOKEN_LIFETIME'] = __import__('datetime').timedelta(seconds=-1)
+def test_jwt_auth_rejects_expired_token(regular_user: User, settings):
+    # Reassign the whole dict so ninja-jwt reloads its settings
+    settings.NINJA_JWT = {**settings.NINJA_JWT, 'ACCESS_TOKEN_LIFETIME': timedelta(seconds=-1)}
     token = CustomAccessToken.for_user(regular_user)
 
     request = Mock()
-    result = JWTAuth().authenticate(request, str(token))
-
-    assert result is None
+    with pytest.raises(InvalidToken):
+        JWTAuth().authenticate(request, str(token))
 
 
-def test_jwt_auth_returns_none_for_invalid_token():
+def test_jwt_auth_rejects_invalid_token():
     request = Mock()
 
-    result = JWTAuth().authenticate(request, 'not-a-jwt')
-
-    assert result is None
+    with pytest.raises(InvalidToken):
+        JWTAuth().authenticate(request, 'not-a-jwt')
 
 
-def test_jwt_auth_returns_none_for_unknown_user(regular_user: User):
-    token = CustomAccessToken.for_user(regular_user)
-    # Delete the user after creating the token
-    regular_user.delete()
+def test_jwt_auth_rejects_unknown_user():
+    user = UserFactory()
+    token = str(CustomAccessToken.for_user(user))
+    # Delete the user the token was issued for
+    user.delete()
 
     request = Mock()
-    result = JWTAuth().authenticate(request, str(token))
-
-    assert result is None
+    with pytest.raises(AuthenticationFailed):
+        JWTAuth().authenticate(request, token)
 
 
-def test_jwt_auth_returns_none_for_inactive_user(regular_user: User):
+def test_jwt_auth_returns_none_for_inactive_user(
+    regular_user: User, regular_user_access_token: str
+):
     regular_user.status = User.STATUS_INACTIVE
     regular_user.save(update_fields=['status'])
 
-    token = CustomAccessToken.for_user(regular_user)
-
     request = Mock()
-    result = JWTAuth().authenticate(request, str(token))
+    result = JWTAuth().authenticate(request, regular_user_access_token)
 
     assert result is None
 
@@ -78,10 +76,8 @@ def test_admin_auth_accepts_staff_user(admin_user: User):
     assert result.id == admin_user.id
 
 
-def test_admin_auth_rejects_non_staff_user(regular_user: User):
-    token = CustomAccessToken.for_user(regular_user)
-
+def test_admin_auth_rejects_non_staff_user(regular_user_access_token: str):
     request = Mock()
-    result = AdminAuth().authenticate(request, str(token))
+    result = AdminAuth().authenticate(request, regular_user_access_token)
 
     assert result is None
@@ -1,6 +1,8 @@
+from unittest.mock import patch
+
 import pytest
-from users.users.backends import EmailBackend
-from users.users.models import User
+from users.backends import EmailBackend
+from users.models import User
 
 pytestmark = [pytest.mark.django_db, pytest.mark.unit]
 
@@ -22,6 +24,16 @@ def test_email_backend_authenticate_wrong_password_returns_none(regular_user: Us
     assert user is None
 
 
+def test_email_backend_authenticate_unknown_email_still_hashes_password():
+    backend = EmailBackend()
+
+    with patch.object(User, 'set_password') as set_password:
+        user = backend.authenticate(None, email='nobody@example.com', password='password123')
+
+    assert user is None
+    set_password.assert_called_once_with('password123')
+
+
 def test_email_backend_authenticate_missing_credentials_returns_none():
     backend = EmailBackend()
 
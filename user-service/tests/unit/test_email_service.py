@@ -0,0 +1,28 @@
+import pytest
+from users.services.email_service import send_email
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_send_email_counts_failing_backend_and_still_sends_through_the_other():
+    """A failing backend is counted as a failure without stopping the others."""
+    called: list[str] = []
+
+    class WorkingBackend:
+        def send_email(self, to, subject, text_body, html_body=None):
+            called.append('working')
+
+    class FailingBackend:
+        def send_email(self, to, subject, text_body, html_body=None):
+            called.append('failing')
+            raise RuntimeError('SES unavailable')
+
+    result = send_email(
+        to='user@example.com',
+        subject='Subject',
+        text_body='Body',
+        backend_classes=[WorkingBackend, FailingBackend],
+    )
+
+    assert result == (1, 1)
+    assert sorted(called) == ['failing', 'working']
@@ -0,0 +1,31 @@
+import pytest
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from users.hashers import TunablePBKDF2PasswordHasher
+
+pytestmark = [pytest.mark.unit]
+
+
+def test_tunable_hasher_uses_configured_iterations(settings):
+    settings.PASSWORD_HASH_ITERATIONS = 1000
+
+    encoded = TunablePBKDF2PasswordHasher().encode('password123', 'salt')
+
+    assert encoded.startswith('pbkdf2_sha256$1000$')
+
+
+def test_tunable_hasher_falls_back_to_django_default(settings):
+    settings.PASSWORD_HASH_ITERATIONS = 0
+
+    hasher = TunablePBKDF2PasswordHasher()
+
+    assert hasher.iterations == PBKDF2PasswordHasher.iterations
+
+
+def test_tunable_hasher_flags_hashes_for_upgrade(settings):
+    hasher = TunablePBKDF2PasswordHasher()
+    settings.PASSWORD_HASH_ITERATIONS = 1000
+    encoded = hasher.encode('password123', 'salt')
+    settings.PASSWORD_HASH_ITERATIONS = 2000
+
+    assert hasher.verify('password123', encoded)
+    assert hasher.must_update(encoded)
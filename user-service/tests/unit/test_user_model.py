@@ -1,6 +1,6 @@
 import pytest
 from django.utils import timezone
-from users.users.models import User
+from users.models import User
 
 pytestmark = [pytest.mark.django_db, pytest.mark.unit]
 
@@ -35,3 +35,14 @@ def test_user_reactivate_clears_inactive_fields(regular_user: User):
     assert regular_user.status == User.STATUS_ACTIVE
     assert regular_user.inactive_at is None
     assert regular_user.inactive_reason == ''
+
+
+def test_user_deactivate_and_delete_revoke_tokens(regular_user: User):
+    regular_user.deactivate('policy violation')
+    assert regular_user.token_version == 1
+
+    regular_user.reactivate()
+    regular_user.mark_deleted()
+    regular_user.refresh_from_db()
+
+    assert regular_user.token_version == 2
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import re
+from collections.abc import Mapping
 from typing import Any
 
 from django import forms
@@ -23,7 +25,6 @@ except NotRegistered:  # pragma: no cover
     pass
 
 
-@admin.register(User)
 class UserAdmin(admin.ModelAdmin):
     """Admin interface for the custom User model."""
 
@@ -68,7 +69,6 @@ class UserAdmin(admin.ModelAdmin):
     )
 
 
-@admin.register(CreditTransaction)
 class CreditTransactionAdmin(admin.ModelAdmin):
     """Admin interface for CreditTransaction."""
 
@@ -79,6 +79,40 @@ class CreditTransactionAdmin(admin.ModelAdmin):
     date_hierarchy = 'created_at'
 
 
+_EXCLUDED_ENV_KEYS = {'DJANGO_SECRET_KEY'}
+_WHITE_LISTED_ENV_KEYS = {'AWS_REGION', 'AWS_SES_SENDER', 'AWS_S3_URI'}
+
+
+_SENSITIVE_ENV_KEY_RE = re.compile(
+    r'SECRET|PASSWORD|TOKEN|_KEY$|^(?:AWS|GCP|AZURE)_', re.IGNORECASE
+)
+
+
+def _is_sensitive_env_key(key: str) -> bool:
+    if key.upper() in _WHITE_LISTED_ENV_KEYS:
+        return False
+    return _SENSITIVE_ENV_KEY_RE.search(key) is not None
+
+
+def _mask(value: Any) -> str:
+    text = str(value)
+    if len(text) <= 4:
+        return '*' * len(text)
+    segment = max(len(text) // 5, 2)
+    hidden_len = max(len(text) - (segment * 2), 0)
+    hidden = '*' * hidden_len
+    return f'{text[:segment]}{hidden}{text[-segment:]}'
+
+
+def masked_environment(env: Mapping[str, str] = os.environ) -> list[tuple[str, str]]:
+    """Return ``env`` sorted by key, with sensitive values masked and excluded keys dropped."""
+    return [
+        (key, _mask(value) if _is_sensitive_env_key(key) else value)
+        for key, value in sorted(env.items(), key=lambda it: it[0].lower())
+        if key not in _EXCLUDED_ENV_KEYS
+    ]
+
+
 class TestEmailForm(forms.Form):
     """Simple form for sending a test email."""
 
@@ -163,38 +197,7 @@ class CustomAdminSite(admin.AdminSite):
                 messages.error(request, 'Please correct the errors below.')
         elif request.method == 'POST' and 'show_environment' in request.POST:
             try:
-                raw_env = sorted(os.environ.items(), key=lambda it: it[0].lower())
-
-                excluded_keys = {'DJANGO_SECRET_KEY'}
-                white_listed_keys = {'AWS_REGION', 'AWS_SES_SENDER', 'AWS_S3_URI'}
-
-                def is_sensitive(key: str) -> bool:
-                    k = key.upper()
-                    if k in white_listed_keys:
-                        return False
-                    if any(flag in k for flag in ['SECRET', 'PASSWORD', 'TOKEN']):
-                        return True
-                    if k.endswith('_KEY'):
-                        return True
-                    if k.startswith(('AWS_', 'GCP_', 'AZURE_')):
-                        return True
-                    return False
-
-                def mask(value: Any) -> str:
-                    text = str(value)
-                    if len(text) <= 4:
-                        return '*' * len(text)
-                    segment = max(len(text) // 5, 2)
-                    hidden_len = max(len(text) - (segment * 2), 0)
-                    hidden = '*' * hidden_len
-                    return f'{text[:segment]}{hidden}{text[-segment:]}'
-
-                environment_variables = []
-                for key, value in raw_env:
-                    if key in excluded_keys:
-                        continue
-                    display_value = mask(value) if is_sensitive(key) else value
-                    environment_variables.append((key, display_value))
+                environment_variables = masked_environment()
                 messages.success(request, 'Environment variables loaded.')
             except Exception as exc:  # pragma: no cover
                 messages.error(request, f'Failed to load environment variables: {exc}')
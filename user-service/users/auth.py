@@ -1,12 +1,23 @@
 from django.http import HttpRequest
 from ninja_jwt.authentication import JWTAuth as BaseJWTAuth
+from ninja_jwt.exceptions import AuthenticationFailed
 
 from .models import User
+from .tokens import TOKEN_VERSION_CLAIM
 
 
 class JWTAuth(BaseJWTAuth):
     """JWT-based authentication for users with status check."""
 
+    def get_user(self, validated_token) -> User:
+        user: User = super().get_user(validated_token)  # type: ignore[assignment]
+
+        # Tokens issued before the claim existed carry no version and match the initial 0.
+        if validated_token.get(TOKEN_VERSION_CLAIM, 0) != user.token_version:
+            raise AuthenticationFailed('Token has been revoked')
+
+        return user
+
     def authenticate(self, request: HttpRequest, token: str) -> User | None:
         user: User | None = super().authenticate(request, token)
 
@@ -6,6 +6,19 @@ from django.http import HttpRequest
 
 from .models import User
 
+# Columns read while logging a user in; everything else stays deferred.
+AUTHENTICATION_FIELDS = (
+    'id',
+    'email',
+    'password',
+    'status',
+    'email_confirmed',
+    'is_active',
+    'is_staff',
+    'is_superuser',
+    'token_version',
+)
+
 
 class EmailBackend(ModelBackend):
     """Authenticate using email instead of username."""
@@ -22,8 +35,11 @@ class EmailBackend(ModelBackend):
             return None
 
         try:
-            user = User.objects.get(email=email)
+            user = User.objects.only(*AUTHENTICATION_FIELDS).get(email=email)
         except User.DoesNotExist:
+            # Run the password hasher anyway so an unknown email takes as long as a wrong
+            # password and does not reveal which accounts exist.
+            User().set_password(password)
             return None
 
         if user.check_password(password):
@@ -0,0 +1,14 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 hasher whose work factor comes from ``PASSWORD_HASH_ITERATIONS``.
+
+    The algorithm name is unchanged, so existing hashes keep verifying and are re-encoded
+    with the configured iteration count on the next successful login.
+    """
+
+    @property
+    def iterations(self) -> int:  # type: ignore[override]
+        return settings.PASSWORD_HASH_ITERATIONS or PBKDF2PasswordHasher.iterations
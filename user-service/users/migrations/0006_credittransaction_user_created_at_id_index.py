@@ -0,0 +1,21 @@
+# Generated by Django 6.0.9 on 2026-10-15 22:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_delete_service'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='credittransaction',
+            name='users_credi_user_id_1e22dd_idx',
+        ),
+        migrations.AddIndex(
+            model_name='credittransaction',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='users_credi_user_id_c591b5_idx'),
+        ),
+    ]
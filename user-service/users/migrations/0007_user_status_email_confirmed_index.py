@@ -0,0 +1,22 @@
+# Generated by Django 6.0.9 on 2026-10-15 22:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0006_credittransaction_user_created_at_id_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['status', 'email_confirmed'], name='users_user_status_51e34e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['is_staff', 'is_active'], name='users_user_is_staf_5f907d_idx'),
+        ),
+    ]
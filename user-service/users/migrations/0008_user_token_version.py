@@ -0,0 +1,18 @@
+# Generated by Django 6.0.9 on 2026-10-15 22:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_user_status_email_confirmed_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, help_text='Embedded in issued JWTs; incrementing it revokes every outstanding token.'),
+        ),
+    ]
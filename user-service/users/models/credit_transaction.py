@@ -37,7 +37,7 @@ class CreditTransaction(models.Model):
     class Meta:
         ordering = ['-created_at', '-id']
         indexes = [
-            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['user', '-created_at', '-id']),
         ]
 
     def __str__(self) -> str:
@@ -37,6 +37,10 @@ class UserManager(BaseUserManager):
         extra_fields.setdefault('is_superuser', True)
         return self.create_user(email, password, **extra_fields)
 
+    def mark_deleted(self, user_id: uuid.UUID) -> bool:
+        """Soft delete a user by id with one UPDATE; return False if no such user exists."""
+        return bool(self.filter(pk=user_id).update(**self.model.deleted_columns()))
+
 
 class User(AbstractBaseUser, PermissionsMixin):
     STATUS_ACTIVE = 'ACTIVE'
@@ -69,6 +73,11 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_staff = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
 
+    token_version = models.PositiveIntegerField(
+        default=0,
+        help_text='Embedded in issued JWTs; incrementing it revokes every outstanding token.',
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -77,22 +86,48 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     objects = UserManager()
 
+    class Meta:
+        indexes = [
+            # Backs the admin changelist filters.
+            models.Index(fields=['status', 'email_confirmed']),
+            models.Index(fields=['is_staff', 'is_active']),
+        ]
+
+    @classmethod
+    def deleted_columns(cls) -> dict:
+        """Column values written when a user is soft deleted; also revokes their tokens."""
+        return {
+            'status': cls.STATUS_DELETED,
+            'deleted_at': timezone.now(),
+            'token_version': models.F('token_version') + 1,
+        }
+
     def mark_deleted(self) -> None:
-        self.status = self.STATUS_DELETED
-        self.deleted_at = timezone.now()
-        self.save(update_fields=['status', 'deleted_at'])
+        self._update_columns(**self.deleted_columns())
 
     def deactivate(self, reason: str = '') -> None:
-        self.status = self.STATUS_INACTIVE
-        self.inactive_at = timezone.now()
-        self.inactive_reason = reason
-        self.save(update_fields=['status', 'inactive_at', 'inactive_reason'])
+        self._update_columns(
+            status=self.STATUS_INACTIVE,
+            inactive_at=timezone.now(),
+            inactive_reason=reason,
+            token_version=models.F('token_version') + 1,
+        )
 
     def reactivate(self) -> None:
-        self.status = self.STATUS_ACTIVE
-        self.inactive_at = None
-        self.inactive_reason = ''
-        self.save(update_fields=['status', 'inactive_at', 'inactive_reason'])
+        self._update_columns(status=self.STATUS_ACTIVE, inactive_at=None, inactive_reason='')
+
+    def _update_columns(self, **values) -> None:
+        """Write ``values`` with a single UPDATE and mirror them on this instance.
+
+        Unlike ``save()`` this skips the model signals, which nothing in the service listens to.
+        Columns set from an expression are left deferred and reload on next access.
+        """
+        type(self)._default_manager.filter(pk=self.pk).update(**values)
+        for field, value in values.items():
+            if hasattr(value, 'resolve_expression'):
+                self.__dict__.pop(field, None)
+            else:
+                setattr(self, field, value)
 
     def __str__(self) -> str:
         return self.email
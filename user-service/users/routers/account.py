@@ -18,9 +18,12 @@ def update_account(request: HttpRequest, payload: AccountUpdateRequest):
     """
     user: User = request.auth  # type: ignore
 
-    # Update name if provided
-    if payload.name is not None:
+    changed = []
+
+    # Update name if provided and different
+    if payload.name is not None and payload.name != user.name:
         user.name = payload.name
+        changed.append('name')
 
     # Update email if provided and different
     if payload.email and payload.email != user.email:
@@ -28,8 +31,10 @@ def update_account(request: HttpRequest, payload: AccountUpdateRequest):
         if User.objects.filter(email=payload.email).exclude(id=user.id).exists():
             raise HttpError(400, 'Email already in use')
         user.email = payload.email
+        changed.append('email')
 
-    user.save()
+    if changed:
+        user.save(update_fields=[*changed, 'updated_at'])
 
     return AccountUpdateResponse(
         message='Profile updated successfully',
@@ -1,6 +1,12 @@
+from functools import partial
+
 from django.conf import settings
 from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
 from django.http import HttpRequest
 from ninja import Router
 from ninja.errors import HttpError
@@ -18,10 +24,22 @@ from ..schemas import (
 )
 from ..services.email_confirmation import get_email_confirmation_service
 from ..services.password_reset import get_password_reset_service
-from ..tokens import CustomAccessToken, CustomRefreshToken
+from ..tokens import TOKEN_VERSION_CLAIM, CustomAccessToken, CustomRefreshToken
 
 router = Router()
 
+_RESEND_CONFIRMATION_MESSAGE = (
+    'If the account exists and is not yet confirmed, a confirmation email will be sent.'
+)
+
+
+def _first_email_request(kind: str, email: str) -> bool:
+    """Return False if ``kind`` was already requested for ``email`` within the cooldown.
+
+    Repeat requests get the generic reply without a user lookup or an email send.
+    """
+    return cache.add(f'{kind}:{email.lower()}', 1, timeout=settings.EMAIL_REQUEST_COOLDOWN_SECONDS)
+
 
 @router.post('/signup', response={201: dict}, auth=None)
 def signup(request: HttpRequest, payload: SignupRequest):
@@ -30,20 +48,19 @@ def signup(request: HttpRequest, payload: SignupRequest):
     if User.objects.filter(email=payload.email).exists():
         raise HttpError(400, 'User with that email already exists.')
 
-    # Create user
+    # Create user, and send the confirmation email only once the row is committed
+    service = get_email_confirmation_service()
     try:
-        user = User.objects.create_user(
-            email=payload.email,
-            password=payload.password,
-            name=payload.name,
-        )
+        with transaction.atomic():
+            user = User.objects.create_user(
+                email=payload.email,
+                password=payload.password,
+                name=payload.name,
+            )
+            transaction.on_commit(partial(service.send_confirmation_email, user))
     except ValidationError as e:
         raise HttpError(400, str(e))
 
-    # Send confirmation email
-    service = get_email_confirmation_service()
-    service.send_confirmation_email(user)
-
     return 201, {'message': 'Account created! Please check your email to confirm your address.'}
 
 
@@ -63,6 +80,9 @@ def confirm_email(request: HttpRequest, payload: EmailConfirmRequest):
 @router.post('/resend-confirmation', response={200: dict}, auth=None)
 def resend_confirmation(request: HttpRequest, payload: ResendConfirmationRequest):
     """Resend email confirmation link."""
+    if not _first_email_request('resend-confirmation', payload.email):
+        return 200, {'message': _RESEND_CONFIRMATION_MESSAGE}
+
     try:
         user = User.objects.get(email=payload.email)
         if not user.email_confirmed:
@@ -71,17 +91,15 @@ def resend_confirmation(request: HttpRequest, payload: ResendConfirmationRequest
     except User.DoesNotExist:
         pass  # Don't reveal whether the email exists
 
-    return 200, {
-        'message': 'If the account exists and is not yet confirmed, '
-        'a confirmation email will be sent.'
-    }
+    return 200, {'message': _RESEND_CONFIRMATION_MESSAGE}
 
 
 @router.post('/forgot-password', response={200: dict}, auth=None)
 def forgot_password(request: HttpRequest, payload: PasswordResetRequest):
     """Start password reset flow for the given email."""
-    service = get_password_reset_service()
-    service.request_reset(email=payload.email)
+    if _first_email_request('forgot-password', payload.email):
+        service = get_password_reset_service()
+        service.request_reset(email=payload.email)
 
     return 200, {
         'message': 'If the account exists, an email will be sent with a password reset link.'
@@ -95,14 +113,15 @@ def reset_password(request: HttpRequest, payload: PasswordResetConfirm):
         raise HttpError(400, 'Passwords do not match.')
 
     service = get_password_reset_service()
-    user = service.validate_token(payload.token)
+    user_id = service.validate_token_user_id(payload.token)
 
-    if user is None:
+    # Write the new hash straight away; a token for a user that no longer exists updates nothing.
+    if user_id is None or not User.objects.filter(pk=user_id).update(
+        password=make_password(payload.password),
+        token_version=F('token_version') + 1,
+    ):
         raise HttpError(400, 'Invalid or expired token.')
 
-    user.set_password(payload.password)
-    user.save(update_fields=['password'])
-
     return 200, {'message': 'Password has been reset.'}
 
 
@@ -147,10 +166,13 @@ def refresh_token(request: HttpRequest, payload: RefreshRequest) -> TokenRespons
 
     # Get user and validate status
     try:
-        user = User.objects.get(id=refresh['sub'])
+        user = User.objects.defer('password', 'last_login').get(id=refresh['sub'])
     except User.DoesNotExist:
         raise HttpError(401, 'User not found')
 
+    if refresh.get(TOKEN_VERSION_CLAIM, 0) != user.token_version:
+        raise HttpError(401, 'Invalid or expired refresh token')
+
     if user.status != User.STATUS_ACTIVE:
         raise HttpError(403, 'User not active')
 
@@ -1,20 +1,26 @@
 from uuid import UUID
 
-from django.db import transaction
 from ninja import Router
 from ninja.errors import HttpError
 
 from ..auth import AdminAuth
-from ..models import CreditTransaction, CreditTransactionType, User
+from ..models import CreditTransactionType, User
 from ..schemas import (
     CreditTransactionRequest,
     CreditTransactionResponse,
     UserCreditsResponse,
 )
+from ..services.credits import apply_credit_transaction
 
 router = Router()
 admin_auth = AdminAuth()
 
+# The balance endpoint only reads the credits; the rest of the row stays deferred.
+_CREDIT_FIELDS = ('id', 'credits')
+
+_TRANSACTION_TYPES = frozenset(CreditTransactionType.values)
+_TRANSACTION_TYPES_TEXT = ', '.join(CreditTransactionType.values)
+
 
 @router.post(
     '/{user_id}/credits',
@@ -26,40 +32,26 @@ def create_credit_transaction(request, user_id: UUID, payload: CreditTransaction
 
     Creates a credit transaction and updates the user's credit balance atomically.
     """
-    try:
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
+    if not User.objects.filter(id=user_id).exists():
         raise HttpError(404, 'User not found')
 
     # Validate transaction type
-    if payload.transaction_type not in [choice[0] for choice in CreditTransactionType.choices]:
-        raise HttpError(
-            400,
-            f'Invalid transaction type. Must be one of: {", ".join([choice[0] for choice in CreditTransactionType.choices])}',
-        )
-
-    # Create transaction and update user credits atomically
-    with transaction.atomic():
-        # Create the transaction record
-        credit_transaction = CreditTransaction.objects.create(
-            user=user,
-            amount=payload.amount,
-            type=payload.transaction_type,
-            description=payload.description,
-        )
-
-        # Update user's credit balance
-        user.credits += payload.amount
-        user.save(update_fields=['credits'])
+    if payload.transaction_type not in _TRANSACTION_TYPES:
+        raise HttpError(400, f'Invalid transaction type. Must be one of: {_TRANSACTION_TYPES_TEXT}')
 
-    return CreditTransactionResponse.model_validate(credit_transaction)
+    return apply_credit_transaction(
+        user_id,
+        amount=payload.amount,
+        transaction_type=payload.transaction_type,
+        description=payload.description,
+    )
 
 
 @router.get('/{user_id}/credits', response=UserCreditsResponse, auth=admin_auth)
 def get_user_credits(request, user_id: UUID):
     """Get the current credit balance for a user."""
     try:
-        user = User.objects.get(id=user_id)
+        user = User.objects.only(*_CREDIT_FIELDS).get(id=user_id)
     except User.DoesNotExist:
         raise HttpError(404, 'User not found')
 
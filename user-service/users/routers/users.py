@@ -15,6 +15,28 @@ from ..schemas import (
 router = Router()
 admin_auth = AdminAuth()
 
+# Columns needed to build a UserResponse; the password hash and the rest stay deferred.
+_USER_RESPONSE_FIELDS = (
+    'id',
+    'email',
+    'name',
+    'status',
+    'credits',
+    'inactive_at',
+    'inactive_reason',
+    'deleted_at',
+    'created_at',
+    'updated_at',
+)
+
+
+def get_user_or_404(user_id: UUID) -> User:
+    """Fetch a user by id with only the response columns, or raise a 404."""
+    try:
+        return User.objects.only(*_USER_RESPONSE_FIELDS).get(id=user_id)
+    except User.DoesNotExist:
+        raise HttpError(404, 'User not found')
+
 
 @router.post('/', response=UserResponse, auth=admin_auth)
 def create_user(request, payload: UserCreateRequest):
@@ -24,72 +46,61 @@ def create_user(request, payload: UserCreateRequest):
         password=payload.password,
         name=payload.name,
     )
-    return UserResponse.model_validate(user)
+    return user
 
 
 @router.get('/{user_id}', response=UserResponse, auth=admin_auth)
 def get_user(request, user_id: UUID):
     """Get user details."""
-    try:
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
-        raise HttpError(404, 'User not found')
+    user = get_user_or_404(user_id)
 
-    return UserResponse.model_validate(user)
+    return user
 
 
 @router.patch('/{user_id}', response=UserResponse, auth=admin_auth)
 def update_user(request, user_id: UUID, payload: UserUpdateRequest):
     """Update user details."""
-    try:
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
-        raise HttpError(404, 'User not found')
+    user = get_user_or_404(user_id)
 
-    if payload.email is not None:
+    changed = []
+    if payload.email is not None and payload.email != user.email:
         user.email = payload.email
-    if payload.name is not None:
+        changed.append('email')
+    if payload.name is not None and payload.name != user.name:
         user.name = payload.name
+        changed.append('name')
 
-    user.save()
+    if changed:
+        user.save(update_fields=[*changed, 'updated_at'])
 
-    return UserResponse.model_validate(user)
+    return user
 
 
 @router.delete('/{user_id}', auth=admin_auth)
 def delete_user(request, user_id: UUID):
     """Soft delete a user."""
-    try:
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
+    # Nothing is returned, so mark the row directly instead of loading it first.
+    if not User.objects.mark_deleted(user_id):
         raise HttpError(404, 'User not found')
 
-    user.mark_deleted()
-
     return {'detail': 'User deleted successfully'}
 
 
 @router.post('/{user_id}/deactivate', response=UserResponse, auth=admin_auth)
 def deactivate_user(request, user_id: UUID, payload: UserDeactivateRequest):
     """Deactivate a user."""
-    try:
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
-        raise HttpError(404, 'User not found')
+    user = get_user_or_404(user_id)
 
     user.deactivate(payload.reason)
 
-    return UserResponse.model_validate(user)
+    return user
 
 
 @router.post('/{user_id}/reactivate', response=UserResponse, auth=admin_auth)
 def reactivate_user(request, user_id: UUID):
     """Reactivate a user."""
-    try:
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
-        raise HttpError(404, 'User not found')
+    user = get_user_or_404(user_id)
 
     user.reactivate()
 
-    return UserResponse.model_validate(user)
+    return user
@@ -2,6 +2,9 @@ from pydantic import BaseModel, EmailStr, field_validator
 
 from ..validators import PasswordValidator
 
+# The validator holds no state, so one instance serves every request.
+_password_validator = PasswordValidator()
+
 
 class LoginRequest(BaseModel):
     email: EmailStr
@@ -17,8 +20,7 @@ class SignupRequest(BaseModel):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password meets requirements."""
-        validator = PasswordValidator()
-        validator.validate(v)
+        _password_validator.validate(v)
         return v
 
 
@@ -43,8 +45,7 @@ class PasswordResetConfirm(BaseModel):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password meets requirements."""
-        validator = PasswordValidator()
-        validator.validate(v)
+        _password_validator.validate(v)
         return v
 
     def validate_passwords_match(self) -> bool:
@@ -0,0 +1,32 @@
+"""Credit balance operations."""
+
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import F
+
+from ..models import CreditTransaction, User
+
+
+def apply_credit_transaction(
+    user_id: UUID,
+    *,
+    amount: int,
+    transaction_type: str,
+    description: str = '',
+) -> CreditTransaction:
+    """Record a credit transaction and apply it to the user's balance atomically.
+
+    The balance is updated in the database with ``F()``, so concurrent transactions for the
+    same user cannot overwrite each other.
+    """
+    with transaction.atomic():
+        credit_transaction = CreditTransaction.objects.create(
+            user_id=user_id,
+            amount=amount,
+            type=transaction_type,
+            description=description,
+        )
+        User.objects.filter(pk=user_id).update(credits=F('credits') + amount)
+
+    return credit_transaction
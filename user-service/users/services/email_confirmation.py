@@ -4,13 +4,18 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 
 from django.conf import settings
-from django.urls import reverse
 from ninja_jwt.exceptions import TokenError
 from ninja_jwt.settings import api_settings
 
 from ..models import User
 from ..tokens import EmailConfirmationToken
 from .email_service import EmailBackendClass, get_email_backend, send_email
+from .token_links import build_token_url
+
+_USER_ID_CLAIM = api_settings.USER_ID_CLAIM
+
+# confirm_email() only writes these columns, so the rest of the row stays deferred.
+_CONFIRMATION_USER_FIELDS = ('id', 'email_confirmed', 'email_confirmed_at')
 
 
 @dataclass(slots=True)
@@ -36,19 +41,17 @@ class EmailConfirmationService:
         )
 
     def _build_confirmation_url(self, token: str) -> str:
-        base = settings.BASE_URL.rstrip('/')
-        path = reverse('confirm-email-page', args=[token])
-        return f'{base}{path}'
+        return build_token_url('confirm-email-page', token)
 
     @staticmethod
     def validate_token(token: str) -> User | None:
         """Validate a confirmation token and return user if valid."""
         try:
             token_obj = EmailConfirmationToken(token)
-            user_id = token_obj.get(api_settings.USER_ID_CLAIM)
+            user_id = token_obj.get(_USER_ID_CLAIM)
             if user_id is None:
                 return None
-            return User.objects.get(pk=user_id)
+            return User.objects.only(*_CONFIRMATION_USER_FIELDS).get(pk=user_id)
         except (TokenError, User.DoesNotExist):
             return None
 
@@ -1,7 +1,9 @@
 """Email service with multiple backend support."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from typing import Protocol
 
 import boto3
@@ -28,6 +30,12 @@ class EmailBackend(Protocol):
 type EmailBackendClass = type[EmailBackend]
 
 
+@lru_cache(maxsize=4)
+def _ses_client(region: str) -> SESClient:
+    """Return a process-wide SES client so HTTPS connections are reused across sends."""
+    return boto3.client('ses', region_name=region)  # type: ignore
+
+
 @dataclass(slots=True)
 class SesEmailBackend:
     """Email backend using AWS SES."""
@@ -45,7 +53,7 @@ class SesEmailBackend:
             html_body = f'<pre>{text_body}</pre>'
 
         region = getattr(settings, 'AWS_REGION', 'us-east-1')
-        client: SESClient = boto3.client('ses', region_name=region)  # type: ignore
+        client = _ses_client(region)
 
         try:
             client.send_email(
@@ -102,7 +110,12 @@ def get_email_backend() -> list[EmailBackendClass]:
 
     Selection is controlled via the `EMAIL_BACKENDS` setting (comma-separated kinds).
     """
-    raw_backends = getattr(settings, 'EMAIL_BACKENDS', '')
+    return list(_resolve_email_backends(getattr(settings, 'EMAIL_BACKENDS', '')))
+
+
+@cache
+def _resolve_email_backends(raw_backends: str) -> tuple[EmailBackendClass, ...]:
+    """Parse and validate an `EMAIL_BACKENDS` value; cached per distinct value."""
     kinds = parse_email_backend_kinds(raw_backends)
 
     if not kinds:
@@ -112,7 +125,7 @@ def get_email_backend() -> list[EmailBackendClass]:
     if unknown:
         raise RuntimeError(f'Unknown EMAIL_BACKENDS kind(s): {unknown}')
 
-    return [EMAIL_BACKEND_KIND_TO_CLASS[k] for k in kinds]
+    return tuple(EMAIL_BACKEND_KIND_TO_CLASS[k] for k in kinds)
 
 
 def build_email_backend(backend_cls: EmailBackendClass) -> EmailBackend:
@@ -138,17 +151,28 @@ def send_email(
     if backend_classes is None:
         backend_classes = get_email_backend()
 
-    successes = 0
-    failures = 0
+    message = {'to': to, 'subject': subject, 'text_body': text_body, 'html_body': html_body}
+    if len(backend_classes) == 1:
+        results = [_send_with_backend(backend_classes[0], message)]
+    else:
+        # Backends talk to independent services, so wait for the slowest one rather than for
+        # all of them in turn. The pool belongs to this call, so requests never queue on it.
+        with ThreadPoolExecutor(max_workers=len(backend_classes)) as pool:
+            results = list(
+                pool.map(_send_with_backend, backend_classes, [message] * len(backend_classes))
+            )
+
+    successes = sum(results)
+    return successes, len(results) - successes
 
-    for backend_cls in backend_classes:
+
+def _send_with_backend(backend_cls: EmailBackendClass, message: dict[str, str | None]) -> bool:
+    """Send ``message`` through one backend, logging instead of raising on failure."""
+    try:
+        backend = build_email_backend(backend_cls)
+        backend.send_email(**message)  # type: ignore[arg-type]
+    except Exception:
         backend_name = getattr(backend_cls, '__name__', str(backend_cls))
-        try:
-            backend = build_email_backend(backend_cls)
-            backend.send_email(to=to, subject=subject, text_body=text_body, html_body=html_body)
-            successes += 1
-        except Exception:
-            failures += 1
-            logger.exception('Email backend %s failed to send email', backend_name)
-
-    return successes, failures
+        logger.exception('Email backend %s failed to send email', backend_name)
+        return False
+    return True
@@ -3,13 +3,16 @@
 from dataclasses import dataclass
 
 from django.conf import settings
-from django.urls import reverse
 from ninja_jwt.exceptions import TokenError
 from ninja_jwt.settings import api_settings
 
 from ..models import User
 from ..tokens import PasswordResetToken
 from .email_service import EmailBackendClass, get_email_backend, send_email
+from .token_links import build_token_url
+
+# Columns the reset flow reads from the user; the rest of the row stays deferred.
+_RESET_USER_FIELDS = ('id', 'email', 'name')
 
 
 @dataclass(slots=True)
@@ -24,9 +27,8 @@ class PasswordResetService:
         If the user does not exist, this method does nothing. This keeps behavior
         indistinguishable from the caller's perspective.
         """
-        try:
-            user = User.objects.get(email=email)
-        except User.DoesNotExist:
+        user = User.objects.only(*_RESET_USER_FIELDS).filter(email=email).first()
+        if user is None:
             return
 
         token = PasswordResetToken.for_user(user)
@@ -44,20 +46,20 @@ class PasswordResetService:
         )
 
     def _build_reset_url(self, token: str) -> str:
-        base = settings.BASE_URL.rstrip('/')
-        path = reverse('reset-password-page', args=[token])
-        return f'{base}{path}'
+        return build_token_url('reset-password-page', token)
+
+    @staticmethod
+    def is_token_valid(token: str) -> bool:
+        """Return whether the token is valid and its user still exists."""
+        user_id = PasswordResetService.validate_token_user_id(token)
+        return user_id is not None and User.objects.filter(pk=user_id).exists()
 
     @staticmethod
-    def validate_token(token: str) -> User | None:
-        """Validate a password reset token and return user if valid."""
+    def validate_token_user_id(token: str) -> str | None:
+        """Validate a password reset token and return its user id without touching the DB."""
         try:
-            token_obj = PasswordResetToken(token)
-            user_id = token_obj.get(api_settings.USER_ID_CLAIM)
-            if user_id is None:
-                return None
-            return User.objects.get(pk=user_id)
-        except (TokenError, User.DoesNotExist):
+            return PasswordResetToken(token).get(api_settings.USER_ID_CLAIM)
+        except TokenError:
             return None
 
 
@@ -0,0 +1,19 @@
+"""Absolute links to pages that take a token, such as email confirmation and password reset."""
+
+from functools import cache
+
+from django.conf import settings
+from django.urls import reverse
+
+_TOKEN_PLACEHOLDER = '__token__'
+
+
+@cache
+def _url_template(url_name: str, base_url: str) -> str:
+    """Reverse ``url_name`` once per base URL; the token is substituted per call."""
+    return base_url.rstrip('/') + reverse(url_name, args=[_TOKEN_PLACEHOLDER])
+
+
+def build_token_url(url_name: str, token: str) -> str:
+    """Return the absolute URL of the ``url_name`` page for ``token``."""
+    return _url_template(url_name, settings.BASE_URL).replace(_TOKEN_PLACEHOLDER, token)
@@ -1,12 +1,28 @@
 from datetime import timedelta
+from typing import ClassVar
 
 from django.conf import settings
+from ninja_jwt import settings as jwt_settings
 from ninja_jwt.tokens import Token
 
 from .models import User
 
+# Carries User.token_version; a token whose value no longer matches the user's is revoked.
+TOKEN_VERSION_CLAIM = 'tv'
 
-class CustomAccessToken(Token):
+
+class _ConfiguredLifetimeToken(Token):
+    """Token whose lifetime is the ``NINJA_JWT`` setting named by ``lifetime_setting``."""
+
+    lifetime_setting: ClassVar[str]
+
+    @property
+    def lifetime(self) -> timedelta:  # type: ignore[override]
+        # Looked up on the module: ninja-jwt rebinds api_settings when NINJA_JWT changes.
+        return getattr(jwt_settings.api_settings, self.lifetime_setting)
+
+
+class CustomAccessToken(_ConfiguredLifetimeToken):
     """Custom access token."""
 
     token_type = 'access'
@@ -17,19 +33,22 @@ class CustomAccessToken(Token):
         """Create a token for the given user with basic claims."""
         token = super().for_user(user)
         token['email'] = user.email
+        token[TOKEN_VERSION_CLAIM] = user.token_version
         return token  # type: ignore
 
 
-class CustomRefreshToken(Token):
+class CustomRefreshToken(_ConfiguredLifetimeToken):
     """Custom refresh token."""
 
     token_type = 'refresh'
     lifetime_setting = 'REFRESH_TOKEN_LIFETIME'
-    no_copy_claims = (
-        'token_type',
-        'exp',
-        'iat',
-        'jti',
+    no_copy_claims: ClassVar[frozenset[str]] = frozenset(
+        {
+            'token_type',
+            'exp',
+            'iat',
+            'jti',
+        }
     )
 
     @property
@@ -38,10 +57,10 @@ class CustomRefreshToken(Token):
         access = CustomAccessToken()
 
         # Copy claims from refresh token (except no_copy_claims)
-        for claim, value in self.payload.items():
-            if claim in self.no_copy_claims:
-                continue
-            access[claim] = value
+        no_copy_claims = self.no_copy_claims
+        access.payload.update(
+            {claim: value for claim, value in self.payload.items() if claim not in no_copy_claims}
+        )
 
         return access
 
@@ -50,6 +69,7 @@ class CustomRefreshToken(Token):
         """Create a refresh token for the given user."""
         token = super().for_user(user)
         token['email'] = user.email
+        token[TOKEN_VERSION_CLAIM] = user.token_version
 
         return token  # type: ignore
 
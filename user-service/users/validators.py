@@ -1,7 +1,11 @@
 """Custom password validators for user authentication."""
 
+import re
+
 from django.core.exceptions import ValidationError
 
+_DIGIT_RE = re.compile(r'\d')
+
 
 class PasswordValidator:
     """Validate password requirements: minimum 6 chars and at least one digit."""
@@ -19,7 +23,7 @@ class PasswordValidator:
         if len(password) < 6:
             raise ValidationError('Password must be at least 6 characters long.')
 
-        if not any(char.isdigit() for char in password):
+        if _DIGIT_RE.search(password) is None:
             raise ValidationError('Password must contain at least one digit.')
 
     def get_help_text(self):
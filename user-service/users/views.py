@@ -20,7 +20,12 @@ def credits_history_page(request: HttpRequest) -> HttpResponse:
     """Render the credits usage history page for the authenticated user."""
     user = request.user
 
-    queryset = CreditTransaction.objects.filter(user=user).order_by('-created_at', '-id')
+    # The template only reads these columns; plain dicts skip model instantiation per row.
+    queryset = (
+        CreditTransaction.objects.filter(user=user)
+        .order_by('-created_at', '-id')
+        .values('created_at', 'amount', 'type', 'description')
+    )
     paginator = Paginator(queryset, per_page=25)
 
     page_number = request.GET.get('page', '1')
@@ -56,9 +61,8 @@ def forgot_password_page(request: HttpRequest) -> HttpResponse:
 def reset_password_page(request: HttpRequest, token: str) -> HttpResponse:
     """Render the reset password page or expired page based on token."""
     service = get_password_reset_service()
-    user = service.validate_token(token)
 
-    if user is None:
+    if not service.is_token_valid(token):
         return render(request, 'reset_password_expired.html')
 
     return render(request, 'reset_password.html', {'token': token})